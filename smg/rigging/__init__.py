@@ -0,0 +1,9 @@
+"""
+A simple 3D camera library.
+
+.. note::
+    Importing this package (or its cameras, controllers and helpers subpackages) must stay cheap, since it is
+    imported by many short-lived processes. For that reason, heavy dependencies (pygame, scipy and vg) must only
+    ever be imported locally, inside the functions that actually use them, and never at module level. This is
+    checked by tests/test_imports.py.
+"""
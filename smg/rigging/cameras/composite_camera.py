@@ -1,6 +1,6 @@
 import numpy as np
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .camera import Camera
 from .moveable_camera import MoveableCamera
@@ -26,6 +26,7 @@ class CompositeCamera(MoveableCamera):
         :param up:          The "up" direction for the camera.
         """
         self.__primary_camera = SimpleCamera(position, look, up)  # type: SimpleCamera
+        self.__relative_poses = None                              # type: Optional[np.ndarray]
         self.__secondary_cameras = {}                             # type: Dict[str, Camera]
 
     # PUBLIC METHODS
@@ -40,9 +41,46 @@ class CompositeCamera(MoveableCamera):
         """
         if self.__secondary_cameras.get(name) is None:
             self.__secondary_cameras[name] = camera
+            self.invalidate_relative_poses()
         else:
             raise RuntimeError("The composite already contains a camera named '{}'".format(name))
 
+    def get_relative_poses(self) -> np.ndarray:
+        """
+        Get the relative poses between every pair of secondary cameras in the composite.
+
+        .. note::
+            The secondary cameras are indexed in the order in which they were added to the composite (i.e. the
+            order given by get_secondary_camera_names). Element [i, j] of the result is the rigid transform that
+            maps points from the space of camera j into the space of camera i.
+        .. note::
+            The relative poses are computed once and then cached, on the assumption that the secondary cameras
+            are rigidly attached to the rig (e.g. they are derived cameras based on the primary camera), and so
+            the poses don't change when the rig as a whole moves. The cache is invalidated automatically when
+            a secondary camera is added or removed. If a secondary camera is re-parameterised in some other way
+            (e.g. by modifying the rotation of a derived camera in place), invalidate_relative_poses must be
+            called explicitly.
+
+        :return:    A read-only K*K*4*4 array containing the relative poses between the K secondary cameras.
+        """
+        if self.__relative_poses is None:
+            self.__relative_poses = self.__compute_relative_poses()
+        return self.__relative_poses
+
+    def get_relative_rotations_and_translations(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the relative rotations and translations between every pair of secondary cameras in the composite.
+
+        .. note::
+            For each pair of cameras (i, j), this yields the R and t such that x_i = R x_j + t, where x_j is a
+            point in the space of camera j and x_i is the same point in the space of camera i. These are the
+            pairs needed to construct essential (and thence fundamental) matrices, e.g. E = [t]_x R.
+
+        :return:    A tuple consisting of a K*K*3*3 array of rotations and a K*K*3 array of translations.
+        """
+        relative_poses = self.get_relative_poses()  # type: np.ndarray
+        return relative_poses[:, :, 0:3, 0:3], relative_poses[:, :, 0:3, 3]
+
     def get_secondary_camera(self, name: str) -> Camera:
         """
         Get the secondary camera with the specified name.
@@ -61,9 +99,26 @@ class CompositeCamera(MoveableCamera):
         """
         Get all the secondary cameras in the composite.
 
+        .. note::
+            This returns a copy of the composite's internal dictionary, so that cameras can only be added to or
+            removed from the composite via add_secondary_camera and remove_secondary_camera (which keep the cache
+            of relative poses up to date).
+
         :return:    The secondary cameras in the composite.
         """
-        return self.__secondary_cameras
+        return dict(self.__secondary_cameras)
+
+    def get_secondary_camera_names(self) -> List[str]:
+        """
+        Get the names of all the secondary cameras in the composite, in the order in which they were added.
+
+        :return:    The names of the secondary cameras in the composite.
+        """
+        return list(self.__secondary_cameras.keys())
+
+    def invalidate_relative_poses(self) -> None:
+        """Invalidate the cached relative poses between the secondary cameras in the composite."""
+        self.__relative_poses = None
 
     def move(self, direction: np.ndarray, delta: float) -> "CompositeCamera":
         """
@@ -131,6 +186,7 @@ class CompositeCamera(MoveableCamera):
         """
         if self.__secondary_cameras.get(name) is not None:
             del self.__secondary_cameras[name]
+            self.invalidate_relative_poses()
         else:
             raise RuntimeError("The composite does not contain a camera named '{}'".format(name))
 
@@ -170,3 +226,23 @@ class CompositeCamera(MoveableCamera):
         :return:    A (normalised) vector pointing to the top of the camera.
         """
         return self.__primary_camera.v()
+
+    # PRIVATE METHODS
+
+    def __compute_relative_poses(self) -> np.ndarray:
+        """
+        Compute the relative poses between every pair of secondary cameras in the composite.
+
+        :return:    A read-only K*K*4*4 array containing the relative poses between the K secondary cameras.
+        """
+        # Note: This is imported here rather than at the top of the file to avoid a circular import.
+        from ..helpers.camera_pose_converter import CameraPoseConverter
+
+        # Construct the world-to-camera pose of each secondary camera, together with its inverse.
+        poses = CameraPoseConverter.cameras_to_poses(list(self.__secondary_cameras.values()))  # type: np.ndarray
+        inv_poses = CameraPoseConverter.invert_rigid_poses(poses)                              # type: np.ndarray
+
+        # Compose them to get the transform from the space of each camera j to that of each camera i.
+        relative_poses = np.matmul(poses[:, np.newaxis], inv_poses[np.newaxis, :])  # type: np.ndarray
+        relative_poses.flags.writeable = False
+        return relative_poses
@@ -1,7 +1,4 @@
 import numpy as np
-import vg
-
-from scipy.spatial.transform import Rotation
 
 from .camera import Camera
 from .moveable_camera import MoveableCamera
@@ -20,6 +17,8 @@ class SimpleCamera(MoveableCamera):
         :param look:        A vector pointing in the direction faced by the camera.
         :param up:          The "up" direction for the camera.
         """
+        import vg
+
         self.__position = np.array(position, dtype=np.float64)     # type: np.ndarray
         self.__n = vg.normalize(np.array(look, dtype=np.float64))  # type: np.ndarray
         self.__v = vg.normalize(np.array(up, dtype=np.float64))    # type: np.ndarray
@@ -97,6 +96,8 @@ class SimpleCamera(MoveableCamera):
         :param angle:   The angle by which to rotate (in radians).
         :return:        This camera, after it has been rotated.
         """
+        from scipy.spatial.transform import Rotation
+
         r = Rotation.from_rotvec(np.array(axis, dtype=np.float64) * angle).as_matrix()  # type: np.ndarray
         self.__n = r @ self.__n
         self.__u = r @ self.__u
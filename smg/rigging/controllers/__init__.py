@@ -1 +1,3 @@
+from .batch_keyboard_camera_controller import BatchKeyboardCameraController
+from .frame_timing_telemetry import FrameTimingTelemetry
 from .keyboard_camera_controller import KeyboardCameraController
@@ -0,0 +1,202 @@
+import numpy as np
+
+from typing import List, Optional, Sequence
+
+from ..cameras.camera import Camera
+from ..helpers.camera_pose_converter import CameraPoseConverter
+
+
+class BatchKeyboardCameraController:
+    """
+    A controller that moves a batch of cameras around based on per-camera keyboard input, in the same way that
+    a set of separate KeyboardCameraController instances would, but with each update vectorised over the batch.
+
+    The cameras' states are stored as arrays (one row per camera), and the key states are specified as an N*K
+    boolean array whose columns correspond to the keys listed in KEY_NAMES (see also make_key_states).
+    """
+
+    # PUBLIC CONSTANTS
+
+    # The names of the (pygame) keys that correspond to the columns of the key state array passed to update.
+    KEY_NAMES = ["a", "d", "e", "g", "q", "s", "w", "DOWN", "LEFT", "LSHIFT", "RIGHT", "UP"]  # type: List[str]
+
+    # PRIVATE CONSTANTS
+
+    __A, __D, __E, __G, __Q, __S, __W, __DOWN, __LEFT, __LSHIFT, __RIGHT, __UP = range(12)
+
+    # CONSTRUCTOR
+
+    def __init__(self, cameras: Sequence[Camera], *, canonical_angular_speed: float = 0.03,
+                 canonical_frame_time_ms: float = 16.0, canonical_linear_speed: float = 1.0, ups=None):
+        """
+        Construct a batch keyboard camera controller.
+
+        .. note::
+            The controller works on its own copies of the cameras' states: the cameras themselves are not modified.
+        .. note::
+            If the "up" directions are not explicitly specified, they will default to the up directions of the cameras.
+
+        :param cameras:                 The cameras whose initial states should be used.
+        :param canonical_angular_speed: The desired angular speed (in radians) for the canonical frame time.
+        :param canonical_frame_time_ms: The canonical frame time (in ms).
+        :param canonical_linear_speed:  The desired linear speed for the canonical frame time.
+        :param ups:                     An optional N*3 array of "up" directions for rotations (or a single
+                                        direction to use for all of the cameras).
+        """
+        self.__canonical_angular_speed = canonical_angular_speed  # type: float
+        self.__canonical_frame_time_ms = canonical_frame_time_ms  # type: float
+        self.__canonical_linear_speed = canonical_linear_speed    # type: float
+        self.__ns = BatchKeyboardCameraController.__stack([c.n() for c in cameras])  # type: np.ndarray
+        self.__ps = BatchKeyboardCameraController.__stack([c.p() for c in cameras])  # type: np.ndarray
+        self.__prev_time_ms = None                                # type: Optional[float]
+        self.__us = BatchKeyboardCameraController.__stack([c.u() for c in cameras])  # type: np.ndarray
+        self.__vs = BatchKeyboardCameraController.__stack([c.v() for c in cameras])  # type: np.ndarray
+
+        if ups is not None:
+            self.__ups = np.broadcast_to(np.array(ups, dtype=np.float64), self.__vs.shape).copy()  # type: np.ndarray
+        else:
+            self.__ups = self.__vs.copy()                                                          # type: np.ndarray
+
+    # PUBLIC STATIC METHODS
+
+    @staticmethod
+    def make_key_states(pressed_keys: Sequence[Sequence[bool]]) -> np.ndarray:
+        """
+        Make a key state array from a sequence of pygame-style pressed key sequences (one per camera).
+
+        :param pressed_keys:    A sequence of pressed key sequences, e.g. as returned by pygame.key.get_pressed().
+        :return:                The corresponding N*K key state array.
+        """
+        import pygame
+
+        codes = [getattr(pygame, "K_" + name) for name in BatchKeyboardCameraController.KEY_NAMES]  # type: List[int]
+        return np.array([[keys[code] for code in codes] for keys in pressed_keys], dtype=bool).reshape(-1, len(codes))
+
+    # PUBLIC METHODS
+
+    def get_ns(self) -> np.ndarray:
+        """
+        Get the (normalised) vectors pointing in the directions faced by the cameras.
+
+        :return:    An N*3 array of the vectors pointing in the directions faced by the cameras.
+        """
+        return self.__ns
+
+    def get_poses(self) -> np.ndarray:
+        """
+        Get the poses of the cameras (see CameraPoseConverter.camera_to_pose).
+
+        :return:    An N*4*4 array containing the poses of the cameras.
+        """
+        return CameraPoseConverter.axes_to_poses(self.__ps, self.__us, self.__vs, self.__ns)
+
+    def get_ps(self) -> np.ndarray:
+        """
+        Get the positions of the cameras.
+
+        :return:    An N*3 array of the positions of the cameras.
+        """
+        return self.__ps
+
+    def get_us(self) -> np.ndarray:
+        """
+        Get the (normalised) vectors pointing to the left of the cameras.
+
+        :return:    An N*3 array of the vectors pointing to the left of the cameras.
+        """
+        return self.__us
+
+    def get_vs(self) -> np.ndarray:
+        """
+        Get the (normalised) vectors pointing to the top of the cameras.
+
+        :return:    An N*3 array of the vectors pointing to the top of the cameras.
+        """
+        return self.__vs
+
+    def update(self, key_states: np.ndarray, time_ms: float) -> None:
+        """
+        Move the cameras around based on keyboard input.
+
+        :param key_states:  An N*K boolean array specifying which keys are pressed for each camera.
+        :param time_ms:     The current time (in ms).
+        """
+        # If this is the first occasion on which this function has been called, we can't calculate elapsed time yet,
+        # so simply store the current time and return.
+        if self.__prev_time_ms is None:
+            self.__prev_time_ms = time_ms
+            return
+
+        # Calculate the time that has elapsed since this function was last called,
+        # and scale the angular and linear speeds accordingly.
+        scaling_factor = (time_ms - self.__prev_time_ms) / self.__canonical_frame_time_ms  # type: float
+        angular_speed = self.__canonical_angular_speed * scaling_factor                    # type: float
+        linear_speed = self.__canonical_linear_speed * scaling_factor                      # type: float
+        self.__prev_time_ms = time_ms
+
+        k = np.asarray(key_states, dtype=bool)  # type: np.ndarray
+        shift = k[:, self.__LSHIFT]             # type: np.ndarray
+
+        # Apply linear movements to the cameras as needed. Note that these are applied in the same order as in
+        # KeyboardCameraController.update, to ensure that the results match exactly.
+        self.__move(k[:, self.__W], self.__ns, linear_speed)
+        self.__move(k[:, self.__S], self.__ns, -linear_speed)
+        self.__move(k[:, self.__D], self.__us, -linear_speed)
+        self.__move(k[:, self.__A], self.__us, linear_speed)
+        self.__move(k[:, self.__Q] & ~shift, self.__ups, linear_speed)
+        self.__move(k[:, self.__E] & ~shift, self.__ups, -linear_speed)
+
+        # Apply angular movements to the cameras as needed. Note that since the cameras' axes are updated in place,
+        # each rotation is about the axes as they stand after the preceding rotations, as in the scalar case.
+        self.__rotate(k[:, self.__RIGHT], self.__ups, -angular_speed)
+        self.__rotate(k[:, self.__LEFT], self.__ups, angular_speed)
+        self.__rotate(k[:, self.__UP], self.__us, angular_speed)
+        self.__rotate(k[:, self.__DOWN], self.__us, -angular_speed)
+        self.__rotate(k[:, self.__Q] & shift, self.__ns, -angular_speed)
+        self.__rotate(k[:, self.__E] & shift, self.__ns, angular_speed)
+
+        # Allow the "up" directions used for rotations to be changed.
+        g = k[:, self.__G]  # type: np.ndarray
+        self.__ups[g] = self.__vs[g]
+
+    # PRIVATE STATIC METHODS
+
+    @staticmethod
+    def __stack(vecs: List[np.ndarray]) -> np.ndarray:
+        """
+        Stack a list of 3D vectors into an N*3 array.
+
+        :param vecs:    The vectors.
+        :return:        The N*3 array.
+        """
+        return np.array(vecs, dtype=np.float64).reshape(-1, 3)
+
+    # PRIVATE METHODS
+
+    def __move(self, mask: np.ndarray, directions: np.ndarray, delta: float) -> None:
+        """
+        Move the specified cameras by the specified displacement in the specified directions.
+
+        :param mask:        A boolean mask specifying which cameras to move.
+        :param directions:  An N*3 array of directions in which to move (one per camera).
+        :param delta:       The displacement by which to move.
+        """
+        if np.any(mask):
+            self.__ps[mask] += delta * directions[mask]
+
+    def __rotate(self, mask: np.ndarray, axes: np.ndarray, angle: float) -> None:
+        """
+        Rotate the specified cameras anti-clockwise by the specified angle about the specified axes.
+
+        :param mask:        A boolean mask specifying which cameras to rotate.
+        :param axes:        An N*3 array of the axes about which to rotate (one per camera).
+        :param angle:       The angle by which to rotate (in radians).
+        """
+        if not np.any(mask):
+            return
+
+        from scipy.spatial.transform import Rotation
+
+        r = Rotation.from_rotvec(axes[mask] * angle).as_matrix()  # type: np.ndarray
+        for vecs in (self.__ns, self.__us, self.__vs):
+            vecs[mask] = np.matmul(r, vecs[mask][:, :, np.newaxis])[:, :, 0]
@@ -0,0 +1,171 @@
+import csv
+import json
+import numpy as np
+
+from typing import Dict, Optional, Sequence, Tuple
+
+
+class FrameTimingTelemetry:
+    """
+    A fixed-size ring buffer of per-frame timing and motion statistics for a camera controller.
+
+    Each frame records the time that elapsed since the previous frame, together with the magnitudes of the linear
+    and angular motions that the controller applied during that frame. Once the buffer is full, the oldest frames
+    are overwritten, so the memory used is constant.
+    """
+
+    # CONSTRUCTOR
+
+    def __init__(self, capacity: int = 1024, *, hitch_threshold_ms: float = 33.0):
+        """
+        Construct a frame timing telemetry buffer.
+
+        :param capacity:            The maximum number of frames to keep.
+        :param hitch_threshold_ms:  The frame time (in ms) above which a frame is considered to be a hitch.
+        :raises RuntimeError:       If the capacity is not positive.
+        """
+        if capacity <= 0:
+            raise RuntimeError("The telemetry capacity must be positive")
+
+        self.__angular_motions = np.zeros(capacity)     # type: np.ndarray
+        self.__capacity = capacity                      # type: int
+        self.__frame_count = 0                          # type: int
+        self.__frame_times_ms = np.zeros(capacity)      # type: np.ndarray
+        self.__hitch_threshold_ms = hitch_threshold_ms  # type: float
+        self.__linear_motions = np.zeros(capacity)      # type: np.ndarray
+
+    # PUBLIC METHODS
+
+    def clear(self) -> None:
+        """Clear the telemetry buffer."""
+        self.__frame_count = 0
+
+    def get_angular_motions(self) -> np.ndarray:
+        """
+        Get the magnitudes (in radians) of the angular motions applied in the buffered frames, oldest first.
+
+        :return:    The magnitudes of the angular motions applied in the buffered frames.
+        """
+        return self.__get_ordered(self.__angular_motions)
+
+    def get_frame_count(self) -> int:
+        """
+        Get the total number of frames that have been recorded (including any that have since been overwritten).
+
+        :return:    The total number of frames that have been recorded.
+        """
+        return self.__frame_count
+
+    def get_frame_times_ms(self) -> np.ndarray:
+        """
+        Get the frame times (in ms) of the buffered frames, oldest first.
+
+        :return:    The frame times of the buffered frames.
+        """
+        return self.__get_ordered(self.__frame_times_ms)
+
+    def get_histogram(self, bins=10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get a histogram of the frame times of the buffered frames.
+
+        :param bins:    The number of bins, or a sequence of bin edges (as per np.histogram).
+        :return:        A tuple consisting of the bin counts and the bin edges.
+        """
+        return np.histogram(self.get_frame_times_ms(), bins=bins)
+
+    def get_hitch_count(self) -> int:
+        """
+        Get the number of buffered frames whose frame times exceed the hitch threshold.
+
+        :return:    The number of buffered frames whose frame times exceed the hitch threshold.
+        """
+        return int(np.count_nonzero(self.get_frame_times_ms() > self.__hitch_threshold_ms))
+
+    def get_linear_motions(self) -> np.ndarray:
+        """
+        Get the magnitudes of the linear motions applied in the buffered frames, oldest first.
+
+        :return:    The magnitudes of the linear motions applied in the buffered frames.
+        """
+        return self.__get_ordered(self.__linear_motions)
+
+    def get_percentiles(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[float, float]:
+        """
+        Get the specified percentiles of the frame times of the buffered frames.
+
+        .. note::
+            If no frames have been buffered yet, the percentiles will all be NaN.
+
+        :param percentiles: The percentiles to get.
+        :return:            A dictionary mapping each percentile to the corresponding frame time (in ms).
+        """
+        frame_times_ms = self.get_frame_times_ms()  # type: np.ndarray
+        if len(frame_times_ms) == 0:
+            return {p: float("nan") for p in percentiles}
+
+        values = np.percentile(frame_times_ms, percentiles)  # type: np.ndarray
+        return {p: float(v) for p, v in zip(percentiles, values)}
+
+    def record(self, frame_time_ms: float, linear_motion: float, angular_motion: float) -> None:
+        """
+        Record the statistics for a frame, overwriting the oldest buffered frame if the buffer is full.
+
+        :param frame_time_ms:   The time (in ms) that elapsed since the previous frame.
+        :param linear_motion:   The magnitude of the linear motion applied during the frame.
+        :param angular_motion:  The magnitude (in radians) of the angular motion applied during the frame.
+        """
+        i = self.__frame_count % self.__capacity  # type: int
+        self.__frame_times_ms[i] = frame_time_ms
+        self.__linear_motions[i] = linear_motion
+        self.__angular_motions[i] = angular_motion
+        self.__frame_count += 1
+
+    def save_csv(self, filename: str) -> None:
+        """
+        Save the buffered frames to a CSV file.
+
+        :param filename:    The name of the file.
+        """
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame_time_ms", "linear_motion", "angular_motion"])
+            writer.writerows(zip(
+                self.get_frame_times_ms().tolist(), self.get_linear_motions().tolist(),
+                self.get_angular_motions().tolist()
+            ))
+
+    def save_json(self, filename: str) -> None:
+        """
+        Save the buffered frames, together with summary statistics, to a JSON file.
+
+        :param filename:    The name of the file.
+        """
+        # Note: NaN isn't valid JSON, so the percentiles of an empty buffer are written as nulls instead.
+        percentiles = {
+            "p{}".format(p): v if self.__frame_count > 0 else None for p, v in self.get_percentiles().items()
+        }  # type: Dict[str, Optional[float]]
+        with open(filename, "w") as f:
+            json.dump({
+                "frame_count": self.__frame_count,
+                "hitch_count": self.get_hitch_count(),
+                "hitch_threshold_ms": self.__hitch_threshold_ms,
+                "percentiles_ms": percentiles,
+                "frame_times_ms": self.get_frame_times_ms().tolist(),
+                "linear_motions": self.get_linear_motions().tolist(),
+                "angular_motions": self.get_angular_motions().tolist()
+            }, f, allow_nan=False, indent=4)
+
+    # PRIVATE METHODS
+
+    def __get_ordered(self, values: np.ndarray) -> np.ndarray:
+        """
+        Get the buffered values from the specified ring buffer array, oldest first.
+
+        :param values:  The ring buffer array.
+        :return:        The buffered values, oldest first.
+        """
+        if self.__frame_count <= self.__capacity:
+            return values[:self.__frame_count].copy()
+        else:
+            i = self.__frame_count % self.__capacity  # type: int
+            return np.concatenate((values[i:], values[:i]))
@@ -1,10 +1,10 @@
 import numpy as np
-import pygame
 
 from typing import Optional, Sequence
 
 from ..cameras.moveable_camera import MoveableCamera
 from ..helpers.camera_pose_converter import CameraPoseConverter
+from .frame_timing_telemetry import FrameTimingTelemetry
 
 
 class KeyboardCameraController:
@@ -13,7 +13,8 @@ class KeyboardCameraController:
     # CONSTRUCTOR
 
     def __init__(self, camera: MoveableCamera, *, canonical_angular_speed: float = 0.03,
-                 canonical_frame_time_ms: float = 16.0, canonical_linear_speed: float = 1.0, up=None):
+                 canonical_frame_time_ms: float = 16.0, canonical_linear_speed: float = 1.0,
+                 telemetry: Optional[FrameTimingTelemetry] = None, up=None):
         """
         Construct a keyboard camera controller.
 
@@ -24,6 +25,7 @@ class KeyboardCameraController:
         :param canonical_angular_speed: The desired angular speed (in radians) for the canonical frame time.
         :param canonical_frame_time_ms: The canonical frame time (in ms).
         :param canonical_linear_speed:  The desired linear speed for the canonical frame time.
+        :param telemetry:               An optional buffer in which to record per-frame timing and motion statistics.
         :param up:                      An optional "up" direction for rotations.
         """
         self.__camera = camera                                    # type: MoveableCamera
@@ -31,6 +33,7 @@ class KeyboardCameraController:
         self.__canonical_frame_time_ms = canonical_frame_time_ms  # type: float
         self.__canonical_linear_speed = canonical_linear_speed    # type: float
         self.__prev_time_ms = None                                # type: Optional[float]
+        self.__telemetry = telemetry                              # type: Optional[FrameTimingTelemetry]
 
         if up is not None:
             self.__up = np.array(up, dtype=np.float64)            # type: np.ndarray
@@ -55,6 +58,14 @@ class KeyboardCameraController:
         """
         return CameraPoseConverter.camera_to_pose(self.__camera)
 
+    def get_telemetry(self) -> Optional[FrameTimingTelemetry]:
+        """
+        Get the buffer in which per-frame timing and motion statistics are being recorded (if any).
+
+        :return:    The buffer in which per-frame timing and motion statistics are being recorded, if any, or None.
+        """
+        return self.__telemetry
+
     def update(self, pressed_keys: Sequence[bool], time_ms: float) -> None:
         """
         Move the camera around based on keyboard input from the user.
@@ -62,6 +73,8 @@ class KeyboardCameraController:
         :param pressed_keys:    The keys that are currently pressed.
         :param time_ms:         The current time (in ms).
         """
+        import pygame
+
         # If this is the first occasion on which this function has been called, we can't calculate elapsed time yet,
         # so simply store the current time and return.
         if self.__prev_time_ms is None:
@@ -70,11 +83,18 @@ class KeyboardCameraController:
 
         # Calculate the time that has elapsed since this function was last called,
         # and scale the angular and linear speeds accordingly.
-        scaling_factor = (time_ms - self.__prev_time_ms) / self.__canonical_frame_time_ms  # type: float
-        angular_speed = self.__canonical_angular_speed * scaling_factor                    # type: float
-        linear_speed = self.__canonical_linear_speed * scaling_factor                      # type: float
+        frame_time_ms = time_ms - self.__prev_time_ms                    # type: float
+        scaling_factor = frame_time_ms / self.__canonical_frame_time_ms  # type: float
+        angular_speed = self.__canonical_angular_speed * scaling_factor  # type: float
+        linear_speed = self.__canonical_linear_speed * scaling_factor    # type: float
         self.__prev_time_ms = time_ms
 
+        # If we're recording telemetry, note the camera's current position and orientation, so that we can later
+        # determine how far it moved and rotated during this frame.
+        if self.__telemetry is not None:
+            old_p = self.__camera.p().copy()                                                       # type: np.ndarray
+            old_axes = np.column_stack((self.__camera.u(), self.__camera.v(), self.__camera.n()))  # type: np.ndarray
+
         # Apply linear movements to the camera as needed.
         if pressed_keys[pygame.K_w]:
             self.__camera.move_n(linear_speed)
@@ -106,3 +126,13 @@ class KeyboardCameraController:
         # Allow the user to change the "up" direction used for rotations.
         if pressed_keys[pygame.K_g]:
             self.__up = self.__camera.v()
+
+        # If we're recording telemetry, record the frame time, together with the distance the camera moved and
+        # the angle through which it rotated (computed from the trace of the relative rotation).
+        if self.__telemetry is not None:
+            new_axes = np.column_stack((self.__camera.u(), self.__camera.v(), self.__camera.n()))  # type: np.ndarray
+            cos_angle = (np.trace(new_axes.T @ old_axes) - 1.0) / 2.0                             # type: float
+            self.__telemetry.record(
+                frame_time_ms, np.linalg.norm(self.__camera.p() - old_p),
+                np.arccos(np.clip(cos_angle, -1.0, 1.0))
+            )
@@ -1,2 +1,4 @@
 from .camera_pose_converter import CameraPoseConverter
 from .camera_util import CameraUtil
+from .trajectory_io import TrajectoryIO
+from .view_selector import ViewSelector
@@ -1,5 +1,7 @@
 import numpy as np
 
+from typing import List, Sequence
+
 from ...rigging.cameras import Camera, SimpleCamera
 
 
@@ -8,6 +10,33 @@ class CameraPoseConverter:
 
     # PUBLIC STATIC METHODS
 
+    @staticmethod
+    def axes_to_poses(ps: np.ndarray, us: np.ndarray, vs: np.ndarray, ns: np.ndarray) -> np.ndarray:
+        """
+        Convert arrays of camera positions and axes to an array of pose matrices.
+
+        .. note::
+            The dot products are computed using matmul, which gives bit-identical results to the per-camera
+            dot products in camera_to_pose.
+
+        :param ps:  An N*3 array of camera positions.
+        :param us:  An N*3 array of camera u axes.
+        :param vs:  An N*3 array of camera v axes.
+        :param ns:  An N*3 array of camera n axes.
+        :return:    An N*4*4 array containing the corresponding pose matrices.
+        """
+        poses = np.zeros((len(ps), 4, 4))  # type: np.ndarray
+        poses[:, 0, 0:3] = -us
+        poses[:, 1, 0:3] = -vs
+        poses[:, 2, 0:3] = ns
+
+        rows = ps[:, np.newaxis, :]  # type: np.ndarray
+        poses[:, 0, 3] = np.matmul(rows, us[:, :, np.newaxis])[:, 0, 0]
+        poses[:, 1, 3] = np.matmul(rows, vs[:, :, np.newaxis])[:, 0, 0]
+        poses[:, 2, 3] = -np.matmul(rows, ns[:, :, np.newaxis])[:, 0, 0]
+        poses[:, 3, 3] = 1.0
+        return poses
+
     @staticmethod
     def camera_to_pose(camera: Camera) -> np.ndarray:
         """
@@ -23,6 +52,35 @@ class CameraPoseConverter:
         pose[0:3, 3] = [p.dot(u), p.dot(v), -p.dot(n)]
         return pose
 
+    @staticmethod
+    def cameras_to_poses(cameras: Sequence[Camera]) -> np.ndarray:
+        """
+        Convert a sequence of cameras to an array of pose matrices.
+
+        :param cameras: The cameras.
+        :return:        An N*4*4 array containing the pose matrices of the cameras.
+        """
+        ps = np.array([c.p() for c in cameras], dtype=np.float64).reshape(-1, 3)  # type: np.ndarray
+        us = np.array([c.u() for c in cameras], dtype=np.float64).reshape(-1, 3)  # type: np.ndarray
+        vs = np.array([c.v() for c in cameras], dtype=np.float64).reshape(-1, 3)  # type: np.ndarray
+        ns = np.array([c.n() for c in cameras], dtype=np.float64).reshape(-1, 3)  # type: np.ndarray
+        return CameraPoseConverter.axes_to_poses(ps, us, vs, ns)
+
+    @staticmethod
+    def invert_rigid_poses(poses: np.ndarray) -> np.ndarray:
+        """
+        Invert an array of rigid transforms (e.g. pose matrices), without calling np.linalg.inv on each one.
+
+        :param poses:   An N*4*4 array of rigid transforms.
+        :return:        An N*4*4 array containing their inverses.
+        """
+        rots = poses[:, 0:3, 0:3]              # type: np.ndarray
+        result = np.zeros((len(poses), 4, 4))  # type: np.ndarray
+        result[:, 0:3, 0:3] = np.transpose(rots, (0, 2, 1))
+        result[:, 0:3, 3] = -np.einsum("kji,kj->ki", rots, poses[:, 0:3, 3])
+        result[:, 3, 3] = 1.0
+        return result
+
     @staticmethod
     def modelview_to_pose(modelview: np.ndarray) -> np.ndarray:
         """
@@ -58,3 +116,20 @@ class CameraPoseConverter:
         m = pose.copy()  # type: np.ndarray
         m[1:3, :] *= -1
         return m
+
+    @staticmethod
+    def poses_to_cameras(poses: np.ndarray) -> List[SimpleCamera]:
+        """
+        Convert an array of pose matrices to a list of cameras.
+
+        .. note::
+            Unlike pose_to_camera, this assumes that the poses are rigid, and so inverts them directly rather than
+            calling np.linalg.inv on each one (see invert_rigid_poses).
+
+        :param poses:   An N*4*4 array of pose matrices.
+        :return:        A list of N cameras with the specified poses.
+        """
+        inv_poses = CameraPoseConverter.invert_rigid_poses(poses)  # type: np.ndarray
+        return [
+            SimpleCamera(inv_poses[i, 0:3, 3], inv_poses[i, 0:3, 2], -inv_poses[i, 0:3, 1]) for i in range(len(poses))
+        ]
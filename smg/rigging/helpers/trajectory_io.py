@@ -0,0 +1,292 @@
+import numpy as np
+import warnings
+
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .camera_pose_converter import CameraPoseConverter
+
+
+class TrajectoryIO:
+    """
+    Functions to read and write trajectories in standard text formats (TUM, KITTI and plain 4x4 matrices).
+
+    Trajectories are read into (and written from) N*4*4 arrays of pose matrices in this library's convention,
+    i.e. world-to-camera transforms for cameras whose x, y and z axes are -u, -v and n, respectively (see
+    CameraPoseConverter.camera_to_pose). These can be converted to cameras via CameraPoseConverter.poses_to_cameras.
+
+    The TUM and KITTI formats store camera-to-world transforms. The axes of the cameras in those transforms can
+    follow the OpenCV (x right, y down, z forward), OpenGL (x right, y up, z backward) or ROS (x forward, y left,
+    z up) conventions, as specified by the 'convention' parameter of the relevant functions. Note that this library's
+    camera axes coincide with OpenCV's, so no conversion is needed in that case.
+    """
+
+    # PRIVATE CONSTANTS
+
+    # The format used when writing values. This is enough to round-trip any float64 exactly.
+    __FORMAT = "%.17g"  # type: str
+
+    # The rotations that map points in OpenCV camera coordinates to points in the coordinates of each convention.
+    __CONVENTION_ROTATIONS = {
+        "opencv": np.eye(3),
+        "opengl": np.diag([1.0, -1.0, -1.0]),
+        "ros": np.array([[0.0, 0.0, 1.0], [-1.0, 0.0, 0.0], [0.0, -1.0, 0.0]])
+    }  # type: Dict[str, np.ndarray]
+
+    # PUBLIC STATIC METHODS
+
+    @staticmethod
+    def iterate_kitti(filename: str, *, chunk_size: int = 65536,
+                      convention: str = "opencv") -> Iterator[np.ndarray]:
+        """
+        Iterate over a KITTI trajectory file (one row-major 3x4 camera-to-world matrix per line) in chunks.
+
+        :param filename:    The name of the file.
+        :param chunk_size:  The maximum number of poses in each chunk (which bounds the memory used per chunk).
+        :param convention:  The axis convention used by the cameras in the file.
+        :return:            An iterator over the chunks, each of which is an M*4*4 array of pose matrices.
+        """
+        for rows in TrajectoryIO.__iterate_rows(filename, 12, chunk_size):
+            camera_to_world = np.zeros((len(rows), 4, 4))  # type: np.ndarray
+            camera_to_world[:, 0:3, :] = rows.reshape(-1, 3, 4)
+            camera_to_world[:, 3, 3] = 1.0
+            yield TrajectoryIO.poses_from_camera_to_world(camera_to_world, convention=convention)
+
+    @staticmethod
+    def iterate_matrices(filename: str, *, chunk_size: int = 65536) -> Iterator[np.ndarray]:
+        """
+        Iterate over a file containing a sequence of 4x4 pose matrices (each written as four lines of four numbers).
+
+        .. note::
+            The matrices are assumed to be in this library's convention, and are returned unchanged.
+
+        :param filename:    The name of the file.
+        :param chunk_size:  The maximum number of poses in each chunk (which bounds the memory used per chunk).
+        :return:            An iterator over the chunks, each of which is an M*4*4 array of pose matrices.
+        """
+        # Note: A chunk can end part-way through a matrix (e.g. if the file contains blank lines), so any rows left
+        #       over at the end of one chunk are carried over to the next.
+        leftover = np.zeros((0, 4))  # type: np.ndarray
+        for rows in TrajectoryIO.__iterate_rows(filename, 4, chunk_size * 4):
+            rows = np.concatenate((leftover, rows))
+            n = len(rows) // 4 * 4  # type: int
+            leftover = rows[n:]
+            if n > 0:
+                yield rows[:n].reshape(-1, 4, 4)
+
+        if len(leftover) > 0:
+            raise RuntimeError("The file '{}' does not contain a whole number of 4x4 matrices".format(filename))
+
+    @staticmethod
+    def iterate_tum(filename: str, *, chunk_size: int = 65536,
+                    convention: str = "opencv") -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Iterate over a TUM trajectory file (one 'timestamp tx ty tz qx qy qz qw' camera-to-world pose per line)
+        in chunks.
+
+        :param filename:    The name of the file.
+        :param chunk_size:  The maximum number of poses in each chunk (which bounds the memory used per chunk).
+        :param convention:  The axis convention used by the cameras in the file.
+        :return:            An iterator over the chunks, each of which is a tuple consisting of an M-element array
+                            of timestamps and an M*4*4 array of pose matrices.
+        """
+        from scipy.spatial.transform import Rotation
+
+        for rows in TrajectoryIO.__iterate_rows(filename, 8, chunk_size):
+            camera_to_world = np.zeros((len(rows), 4, 4))  # type: np.ndarray
+            camera_to_world[:, 0:3, 0:3] = Rotation.from_quat(rows[:, 4:8]).as_matrix()
+            camera_to_world[:, 0:3, 3] = rows[:, 1:4]
+            camera_to_world[:, 3, 3] = 1.0
+            yield rows[:, 0], TrajectoryIO.poses_from_camera_to_world(camera_to_world, convention=convention)
+
+    @staticmethod
+    def poses_from_camera_to_world(camera_to_world: np.ndarray, *, convention: str = "opencv") -> np.ndarray:
+        """
+        Convert an array of rigid camera-to-world transforms in the specified axis convention to pose matrices.
+
+        :param camera_to_world: An N*4*4 array of rigid camera-to-world transforms.
+        :param convention:      The axis convention used by the cameras.
+        :return:                An N*4*4 array of pose matrices in this library's convention.
+        """
+        # Note: If T maps points in the (convention) camera's coordinates to world coordinates, and A maps points
+        #       in OpenCV camera coordinates to points in the convention's coordinates, the pose is A^T T^-1.
+        a = TrajectoryIO.__get_convention_rotation(convention)  # type: np.ndarray
+        poses = CameraPoseConverter.invert_rigid_poses(camera_to_world)    # type: np.ndarray
+        poses[:, 0:3, :] = np.einsum("ji,kjl->kil", a, poses[:, 0:3, :])
+        return poses
+
+    @staticmethod
+    def poses_to_camera_to_world(poses: np.ndarray, *, convention: str = "opencv") -> np.ndarray:
+        """
+        Convert an array of pose matrices to rigid camera-to-world transforms in the specified axis convention.
+
+        :param poses:       An N*4*4 array of pose matrices in this library's convention.
+        :param convention:  The axis convention to use for the cameras.
+        :return:            An N*4*4 array of rigid camera-to-world transforms.
+        """
+        a = TrajectoryIO.__get_convention_rotation(convention)  # type: np.ndarray
+        m = np.array(poses, dtype=np.float64)                   # type: np.ndarray
+        m[:, 0:3, :] = np.einsum("ij,kjl->kil", a, m[:, 0:3, :])
+        return CameraPoseConverter.invert_rigid_poses(m)
+
+    @staticmethod
+    def read_kitti(filename: str, *, convention: str = "opencv") -> np.ndarray:
+        """
+        Read a KITTI trajectory file (one row-major 3x4 camera-to-world matrix per line).
+
+        :param filename:    The name of the file.
+        :param convention:  The axis convention used by the cameras in the file.
+        :return:            An N*4*4 array of pose matrices.
+        """
+        return TrajectoryIO.__concatenate(
+            list(TrajectoryIO.iterate_kitti(filename, convention=convention)), (0, 4, 4)
+        )
+
+    @staticmethod
+    def read_matrices(filename: str) -> np.ndarray:
+        """
+        Read a file containing a sequence of 4x4 pose matrices (each written as four lines of four numbers).
+
+        :param filename:    The name of the file.
+        :return:            An N*4*4 array of pose matrices.
+        """
+        return TrajectoryIO.__concatenate(
+            list(TrajectoryIO.iterate_matrices(filename)), (0, 4, 4)
+        )
+
+    @staticmethod
+    def read_tum(filename: str, *, convention: str = "opencv") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read a TUM trajectory file (one 'timestamp tx ty tz qx qy qz qw' camera-to-world pose per line).
+
+        :param filename:    The name of the file.
+        :param convention:  The axis convention used by the cameras in the file.
+        :return:            A tuple consisting of an N-element array of timestamps and an N*4*4 array of pose matrices.
+        """
+        chunks = list(
+            TrajectoryIO.iterate_tum(filename, convention=convention)
+        )  # type: List[Tuple[np.ndarray, np.ndarray]]
+        return TrajectoryIO.__concatenate([t for t, _ in chunks], (0,)), \
+            TrajectoryIO.__concatenate([p for _, p in chunks], (0, 4, 4))
+
+    @staticmethod
+    def write_kitti(filename: str, poses: np.ndarray, *, append: bool = False, convention: str = "opencv") -> None:
+        """
+        Write a KITTI trajectory file (one row-major 3x4 camera-to-world matrix per line).
+
+        :param filename:    The name of the file.
+        :param poses:       An N*4*4 array of pose matrices in this library's convention.
+        :param append:      Whether to append to the file (e.g. when writing chunks) rather than overwriting it.
+        :param convention:  The axis convention to use for the cameras in the file.
+        """
+        camera_to_world = TrajectoryIO.poses_to_camera_to_world(poses, convention=convention)  # type: np.ndarray
+        TrajectoryIO.__write_rows(filename, camera_to_world[:, 0:3, :].reshape(-1, 12), append, TrajectoryIO.__FORMAT)
+
+    @staticmethod
+    def write_matrices(filename: str, poses: np.ndarray, *, append: bool = False) -> None:
+        """
+        Write a file containing a sequence of 4x4 pose matrices (each written as four lines of four numbers).
+
+        :param filename:    The name of the file.
+        :param poses:       An N*4*4 array of pose matrices in this library's convention.
+        :param append:      Whether to append to the file (e.g. when writing chunks) rather than overwriting it.
+        """
+        TrajectoryIO.__write_rows(filename, np.asarray(poses).reshape(-1, 4), append, TrajectoryIO.__FORMAT)
+
+    @staticmethod
+    def write_tum(filename: str, timestamps: np.ndarray, poses: np.ndarray, *,
+                  append: bool = False, convention: str = "opencv") -> None:
+        """
+        Write a TUM trajectory file (one 'timestamp tx ty tz qx qy qz qw' camera-to-world pose per line).
+
+        :param filename:    The name of the file.
+        :param timestamps:  An N-element array of timestamps.
+        :param poses:       An N*4*4 array of pose matrices in this library's convention.
+        :param append:      Whether to append to the file (e.g. when writing chunks) rather than overwriting it.
+        :param convention:  The axis convention to use for the cameras in the file.
+        """
+        from scipy.spatial.transform import Rotation
+
+        camera_to_world = TrajectoryIO.poses_to_camera_to_world(poses, convention=convention)  # type: np.ndarray
+        rows = np.zeros((len(camera_to_world), 8))  # type: np.ndarray
+        rows[:, 0] = timestamps
+        rows[:, 1:4] = camera_to_world[:, 0:3, 3]
+        rows[:, 4:8] = Rotation.from_matrix(camera_to_world[:, 0:3, 0:3]).as_quat()
+        TrajectoryIO.__write_rows(filename, rows, append, TrajectoryIO.__FORMAT)
+
+    # PRIVATE STATIC METHODS
+
+    @staticmethod
+    def __concatenate(chunks: List[np.ndarray], empty_shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Concatenate a list of chunks into a single array.
+
+        :param chunks:      The chunks.
+        :param empty_shape: The shape of the array to return if there are no chunks.
+        :return:            The concatenated array.
+        """
+        return np.concatenate(chunks) if len(chunks) > 0 else np.zeros(empty_shape)
+
+    @staticmethod
+    def __get_convention_rotation(convention: str) -> np.ndarray:
+        """
+        Get the rotation that maps points in OpenCV camera coordinates to points in the specified convention's.
+
+        :param convention:      The axis convention.
+        :return:                The corresponding rotation.
+        :raises RuntimeError:   If the convention is unknown.
+        """
+        a = TrajectoryIO.__CONVENTION_ROTATIONS.get(convention)  # type: Optional[np.ndarray]
+        if a is not None:
+            return a
+        else:
+            raise RuntimeError("Unknown axis convention '{}'".format(convention))
+
+    @staticmethod
+    def __iterate_rows(filename: str, cols: int, chunk_lines: int) -> Iterator[np.ndarray]:
+        """
+        Iterate over the numeric rows of a whitespace-separated text file in chunks.
+
+        .. note::
+            Blank lines and lines starting with '#' are skipped.
+
+        :param filename:        The name of the file.
+        :param cols:            The number of values expected on each row.
+        :param chunk_lines:     The maximum number of lines (including any blank lines or comments) per chunk.
+        :return:                An iterator over the chunks, each of which is an M*cols array.
+        :raises RuntimeError:   If the file contains a row with the wrong number of values.
+        """
+        with open(filename, "r") as f:
+            while True:
+                lines = list(islice(f, chunk_lines))  # type: List[str]
+                if len(lines) == 0:
+                    break
+
+                # Parse the whole chunk in one go. Note that np.loadtxt skips blank lines and comments, and warns
+                # if a chunk contains nothing else, which is harmless here.
+                try:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore", UserWarning)
+                        rows = np.loadtxt(lines, dtype=np.float64, comments="#", ndmin=2)  # type: np.ndarray
+                except ValueError as e:
+                    raise RuntimeError("The file '{}' could not be parsed: {}".format(filename, e)) from e
+
+                if rows.size == 0:
+                    continue
+                if rows.shape[1] != cols:
+                    raise RuntimeError("The file '{}' contains rows without exactly {} values".format(filename, cols))
+
+                yield rows
+
+    @staticmethod
+    def __write_rows(filename: str, rows: np.ndarray, append: bool, fmt) -> None:
+        """
+        Write an array of rows to a whitespace-separated text file.
+
+        :param filename:    The name of the file.
+        :param rows:        The rows.
+        :param append:      Whether to append to the file rather than overwriting it.
+        :param fmt:         The format (or sequence of formats) to use for the values.
+        """
+        with open(filename, "a" if append else "w") as f:
+            np.savetxt(f, rows, fmt=fmt)
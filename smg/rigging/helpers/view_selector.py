@@ -0,0 +1,248 @@
+import heapq
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import scipy.sparse
+
+
+class ViewSelector:
+    """
+    Selects a small set of views from a (potentially large) set of candidate camera poses so as to cover a point cloud.
+
+    The selection proceeds in two stages. First, a sparse candidate-by-point visibility matrix is computed by testing
+    every point against the view frustum (and depth range) of every candidate pose. Then, a small set of candidates
+    that together see as many points as possible is chosen by lazy greedy set cover.
+
+    .. note::
+        The visibility test does not account for occlusion: a point is deemed to be visible from a candidate pose
+        if it projects into the image and lies within the depth range, regardless of what lies in front of it.
+    """
+
+    # PRIVATE STATIC VARIABLES
+
+    # The points for which a worker process is computing visibility (see ViewSelector.compute_visibility).
+    # Note: This is only set in the worker processes, by _initialise_worker.
+    _worker_points = None  # type: Optional[np.ndarray]
+
+    # CONSTRUCTOR
+
+    def __init__(self, points: np.ndarray, image_size: Tuple[int, int],
+                 intrinsics: Tuple[float, float, float, float], *, max_depth: float = 10.0, min_depth: float = 0.1):
+        """
+        Construct a view selector.
+
+        :param points:      An N*3 array containing the points to cover.
+        :param image_size:  The image size, as a (width, height) tuple.
+        :param intrinsics:  The camera intrinsics, as an (fx, fy, cx, cy) tuple.
+        :param max_depth:   The maximum depth at which a point can be considered visible.
+        :param min_depth:   The minimum depth at which a point can be considered visible.
+        """
+        self.__image_size = image_size                      # type: Tuple[int, int]
+        self.__intrinsics = intrinsics                      # type: Tuple[float, float, float, float]
+        self.__max_depth = max_depth                        # type: float
+        self.__min_depth = min_depth                        # type: float
+        self.__points = np.array(points, dtype=np.float64)  # type: np.ndarray
+
+    # PUBLIC STATIC METHODS
+
+    @staticmethod
+    def compute_visibility_chunk(poses: np.ndarray, points: np.ndarray, image_size: Tuple[int, int],
+                                 intrinsics: Tuple[float, float, float, float], min_depth: float, max_depth: float,
+                                 point_chunk_size: int = 16384) -> "scipy.sparse.csr_matrix":
+        """
+        Compute which of the specified points are visible from each of a chunk of candidate poses.
+
+        .. note::
+            The points are processed point_chunk_size at a time, so the dense intermediates for M poses take up
+            at most about M * point_chunk_size * 64 bytes, regardless of the number of points (e.g. about 64MB for
+            64 poses and the default point chunk size). Each point chunk is then immediately converted into a CSR
+            block, which takes up 5 bytes per visible (pose, point) pair (a bool value and an int32 point index).
+
+        :param poses:               An M*4*4 array of candidate poses (world-to-camera transforms, as per
+                                    CameraPoseConverter).
+        :param points:              An N*3 array of points.
+        :param image_size:          The image size, as a (width, height) tuple.
+        :param intrinsics:          The camera intrinsics, as an (fx, fy, cx, cy) tuple.
+        :param min_depth:           The minimum depth at which a point can be considered visible.
+        :param max_depth:           The maximum depth at which a point can be considered visible.
+        :param point_chunk_size:    The number of points to process at once.
+        :return:                    An M*N boolean matrix (in scipy's CSR format) whose (i, j) element indicates
+                                    whether point j is visible from pose i of the chunk.
+        """
+        import scipy.sparse
+
+        width, height = image_size
+        fx, fy, cx, cy = intrinsics
+
+        blocks = [scipy.sparse.csr_matrix((len(poses), 0), dtype=bool)]  # type: List[scipy.sparse.csr_matrix]
+
+        for start in range(0, len(points), point_chunk_size):
+            # Transform the points in the chunk into the space of each camera.
+            chunk_points = points[start:start + point_chunk_size]  # type: np.ndarray
+            cam_points = np.einsum(
+                "mij,nj->mni", poses[:, 0:3, 0:3], chunk_points
+            ) + poses[:, np.newaxis, 0:3, 3]  # type: np.ndarray
+            x, y, z = cam_points[..., 0], cam_points[..., 1], cam_points[..., 2]
+
+            # Test them against each camera's depth range and frustum.
+            visible = (z >= min_depth) & (z <= max_depth)  # type: np.ndarray
+            with np.errstate(divide="ignore", invalid="ignore"):
+                px = fx * x / z + cx  # type: np.ndarray
+                py = fy * y / z + cy  # type: np.ndarray
+            visible &= (px >= 0) & (px < width) & (py >= 0) & (py < height)
+
+            blocks.append(scipy.sparse.csr_matrix(visible))
+
+        return scipy.sparse.hstack(blocks, format="csr")
+
+    # PUBLIC METHODS
+
+    def compute_visibility(self, poses: np.ndarray, *, chunk_size: int = 64, max_workers: Optional[int] = 1,
+                           point_chunk_size: int = 16384) -> "scipy.sparse.csr_matrix":
+        """
+        Compute a sparse candidate-by-point visibility matrix for the specified candidate poses.
+
+        .. note::
+            By default, the chunks are processed serially. If max_workers is anything other than 1, they are
+            instead processed in parallel using a process pool, and the points are sent to each worker process
+            once, when it starts, rather than with every chunk.
+        .. note::
+            The peak memory used is roughly P * chunk_size * point_chunk_size * 64 bytes for the dense
+            intermediates (where P is the number of processes in use, see compute_visibility_chunk), plus
+            10 bytes per visible (pose, point) pair, since the per-chunk CSR blocks (5 bytes per pair) and the
+            final matrix they are stacked into briefly coexist.
+
+        :param poses:               An M*4*4 array of candidate poses (world-to-camera transforms, as per
+                                    CameraPoseConverter).
+        :param chunk_size:          The number of candidate poses to process at once.
+        :param max_workers:         The maximum number of worker processes to use (1 means process the chunks
+                                    serially, and None means use the process pool's default).
+        :param point_chunk_size:    The number of points to process at once.
+        :return:                    An M*N boolean matrix (in scipy's CSR format) whose (i, j) element indicates
+                                    whether point j is visible from candidate pose i.
+        """
+        import scipy.sparse
+
+        poses = np.asarray(poses, dtype=np.float64)
+        starts = list(range(0, len(poses), chunk_size))  # type: List[int]
+        args = (self.__image_size, self.__intrinsics, self.__min_depth, self.__max_depth, point_chunk_size)
+
+        # Compute a CSR block of the visibility matrix for each chunk of candidate poses.
+        if max_workers == 1 or len(starts) <= 1:
+            blocks = [
+                ViewSelector.compute_visibility_chunk(poses[s:s + chunk_size], self.__points, *args) for s in starts
+            ]  # type: List[scipy.sparse.csr_matrix]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=ViewSelector._initialise_worker, initargs=(self.__points,)
+            ) as executor:
+                futures = [
+                    executor.submit(ViewSelector._compute_visibility_chunk_in_worker, poses[s:s + chunk_size], *args)
+                    for s in starts
+                ]
+                blocks = [future.result() for future in futures]
+
+        # Stack the blocks to make the full matrix.
+        if len(blocks) == 0:
+            return scipy.sparse.csr_matrix((0, len(self.__points)), dtype=bool)
+        else:
+            return scipy.sparse.vstack(blocks, format="csr")
+
+    def select_views(self, poses: np.ndarray, *, budget: Optional[int] = None, chunk_size: int = 64,
+                     max_workers: Optional[int] = 1, min_look_rotation: float = 0.0, point_chunk_size: int = 16384,
+                     visibility: Optional["scipy.sparse.csr_matrix"] = None) -> List[int]:
+        """
+        Greedily select a small set of candidate poses that together cover as many of the points as possible.
+
+        .. note::
+            The selection uses lazy greedy set cover: the coverage gain of each candidate can only decrease as
+            more views are selected, so stale gains are upper bounds, and a candidate whose recomputed gain is
+            still at least the best stale gain in the priority queue can be selected without re-scoring the rest.
+        .. note::
+            If min_look_rotation is specified, a candidate is only selected if the rotation between its look
+            vector and that of every view already selected is at least that large (see
+            CameraUtil.compute_look_rotation_c).
+
+        :param poses:               An M*4*4 array of candidate poses (world-to-camera transforms).
+        :param budget:              The maximum number of views to select (None means no limit).
+        :param chunk_size:          The number of candidate poses to process at once when computing visibility.
+        :param max_workers:         The maximum number of worker processes to use when computing visibility
+                                    (see compute_visibility).
+        :param min_look_rotation:   The minimum rotation (in degrees) between the look vectors of any two selected
+                                    views.
+        :param point_chunk_size:    The number of points to process at once when computing visibility.
+        :param visibility:          An optional precomputed visibility matrix (see compute_visibility).
+        :return:                    The indices of the selected candidate poses, in the order they were selected.
+        """
+        poses = np.asarray(poses, dtype=np.float64)
+        if visibility is None:
+            visibility = self.compute_visibility(
+                poses, chunk_size=chunk_size, max_workers=max_workers, point_chunk_size=point_chunk_size
+            )
+
+        covered = np.zeros(visibility.shape[1], dtype=bool)  # type: np.ndarray
+        indices = visibility.indices                         # type: np.ndarray
+        indptr = visibility.indptr                           # type: np.ndarray
+
+        # Note: The look vector of each pose is the third row of its rotation (see CameraPoseConverter).
+        looks = poses[:, 2, 0:3]                              # type: np.ndarray
+        max_look_dot = np.cos(np.deg2rad(min_look_rotation))  # type: float
+
+        # Initialise the priority queue with the initial gain of each candidate (negated, since heapq is a min-heap).
+        heap = [(-int(indptr[i + 1] - indptr[i]), i) for i in range(len(poses))]  # type: List[Tuple[int, int]]
+        heapq.heapify(heap)
+
+        selected = []  # type: List[int]
+        while len(heap) > 0 and (budget is None or len(selected) < budget):
+            _, i = heapq.heappop(heap)
+
+            # Recompute the candidate's gain with respect to the points that have been covered so far.
+            pts = indices[indptr[i]:indptr[i + 1]]       # type: np.ndarray
+            gain = int(np.count_nonzero(~covered[pts]))  # type: int
+            if gain == 0:
+                continue
+
+            # If the candidate is no longer the best, push it back with its updated gain and try again.
+            if len(heap) > 0 and gain < -heap[0][0]:
+                heapq.heappush(heap, (-gain, i))
+                continue
+
+            # Otherwise, select it, provided that it is sufficiently different from the views already selected.
+            # (If it isn't, it never will be, since the set of selected views only grows.)
+            if min_look_rotation > 0.0 and len(selected) > 0:
+                if np.max(looks[selected] @ looks[i]) > max_look_dot:
+                    continue
+
+            selected.append(i)
+            covered[pts] = True
+
+        return selected
+
+
+    # PRIVATE STATIC METHODS
+
+    # Note: The methods below are passed to worker processes by name, so they can't use double-underscore names
+    #       (pickle can't find name-mangled methods by their qualified names).
+
+    @staticmethod
+    def _compute_visibility_chunk_in_worker(poses: np.ndarray, *args) -> "scipy.sparse.csr_matrix":
+        """
+        Compute visibility for a chunk of candidate poses in a worker process, using the points it was initialised with.
+
+        :param poses:   An M*4*4 array of candidate poses.
+        :param args:    The remaining arguments to compute_visibility_chunk (after the points).
+        :return:        The result of compute_visibility_chunk.
+        """
+        return ViewSelector.compute_visibility_chunk(poses, ViewSelector._worker_points, *args)
+
+    @staticmethod
+    def _initialise_worker(points: np.ndarray) -> None:
+        """
+        Initialise a worker process used by compute_visibility.
+
+        :param points:  The points for which the worker will be computing visibility.
+        """
+        ViewSelector._worker_points = points
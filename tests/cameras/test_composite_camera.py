@@ -0,0 +1,68 @@
+import numpy as np
+
+from scipy.spatial.transform import Rotation
+
+from smg.rigging.cameras import CompositeCamera, DerivedCamera
+from smg.rigging.helpers import CameraPoseConverter
+
+
+def make_rig() -> CompositeCamera:
+    rig = CompositeCamera([1, 2, 3], [0, 0, 1], [0, -1, 0])
+    rig.add_secondary_camera("left", DerivedCamera(rig, np.eye(3), [0.1, 0.0, 0.0]))
+    rig.add_secondary_camera("right", DerivedCamera(rig, np.eye(3), [-0.1, 0.0, 0.0]))
+    rig.add_secondary_camera(
+        "tilted", DerivedCamera(rig, Rotation.from_rotvec([0.1, 0.3, -0.2]).as_matrix(), [0.0, 0.2, 0.5])
+    )
+    return rig
+
+
+def compute_expected_relative_poses(rig: CompositeCamera) -> np.ndarray:
+    poses = [CameraPoseConverter.camera_to_pose(c) for c in rig.get_secondary_cameras().values()]
+    return np.array([[pose_i @ np.linalg.inv(pose_j) for pose_j in poses] for pose_i in poses])
+
+
+def test_cached_relative_poses_survive_rig_motion():
+    rig = make_rig()
+    relative_poses = rig.get_relative_poses()
+    assert relative_poses.shape == (3, 3, 4, 4)
+
+    rig.move_n(2.0).move_u(-1.5).rotate([0, 1, 0], 1.1).rotate([1, 0, 0], -0.4)
+
+    assert rig.get_relative_poses() is relative_poses
+    np.testing.assert_allclose(relative_poses, compute_expected_relative_poses(rig), atol=1e-12)
+
+    rots, trans = rig.get_relative_rotations_and_translations()
+    np.testing.assert_array_equal(rots, relative_poses[:, :, 0:3, 0:3])
+    np.testing.assert_array_equal(trans, relative_poses[:, :, 0:3, 3])
+
+
+def test_add_and_remove_invalidate_cache():
+    rig = make_rig()
+    relative_poses = rig.get_relative_poses()
+
+    rig.remove_secondary_camera("tilted")
+    after_remove = rig.get_relative_poses()
+    assert after_remove is not relative_poses
+    assert after_remove.shape == (2, 2, 4, 4)
+    np.testing.assert_allclose(after_remove, compute_expected_relative_poses(rig), atol=1e-12)
+
+    rig.add_secondary_camera("forward", DerivedCamera(rig, np.eye(3), [0.0, 0.0, 1.0]))
+    after_add = rig.get_relative_poses()
+    assert after_add is not after_remove
+    assert after_add.shape == (3, 3, 4, 4)
+    np.testing.assert_allclose(after_add, compute_expected_relative_poses(rig), atol=1e-12)
+
+
+def test_mutating_returned_cameras_does_not_affect_rig():
+    rig = make_rig()
+    rig.get_secondary_cameras().clear()
+    assert rig.get_secondary_camera_names() == ["left", "right", "tilted"]
+
+
+def test_no_secondary_cameras():
+    rig = CompositeCamera([0, 0, 0], [0, 0, 1], [0, -1, 0])
+    assert rig.get_relative_poses().shape == (0, 0, 4, 4)
+
+    rots, trans = rig.get_relative_rotations_and_translations()
+    assert rots.shape == (0, 0, 3, 3)
+    assert trans.shape == (0, 0, 3)
@@ -0,0 +1,83 @@
+import numpy as np
+import pygame
+
+from smg.rigging.cameras import SimpleCamera
+from smg.rigging.controllers import BatchKeyboardCameraController, KeyboardCameraController
+
+
+class PressedKeys:
+    """A pygame-style pressed key sequence backed by one row of a batch key state array."""
+
+    def __init__(self, row: np.ndarray):
+        self.__pressed = {
+            getattr(pygame, "K_" + name): bool(pressed)
+            for name, pressed in zip(BatchKeyboardCameraController.KEY_NAMES, row)
+        }
+
+    def __getitem__(self, key: int) -> bool:
+        return self.__pressed.get(key, False)
+
+
+def make_cameras(rng: np.random.Generator, n: int):
+    return [SimpleCamera(rng.normal(size=3), rng.normal(size=3), rng.normal(size=3)) for _ in range(n)]
+
+
+def test_batch_update_matches_scalar_update_exactly():
+    rng = np.random.default_rng(12345)
+    n, frames = 20, 300
+    key_names = BatchKeyboardCameraController.KEY_NAMES
+
+    # Note: The batch controller works on its own copies of the cameras' states, so we can share the cameras.
+    cameras = make_cameras(rng, n)
+    scalar_controllers = [KeyboardCameraController(camera) for camera in cameras]
+    batch_controller = BatchKeyboardCameraController(cameras)
+
+    seen_g = seen_shift_q = seen_shift_e = False
+    time_ms = 0.0
+    for _ in range(frames):
+        key_states = rng.random((n, len(key_names))) < 0.3
+        time_ms += rng.uniform(5.0, 40.0)
+
+        for controller, row in zip(scalar_controllers, key_states):
+            controller.update(PressedKeys(row), time_ms)
+        batch_controller.update(key_states, time_ms)
+
+        shift = key_states[:, key_names.index("LSHIFT")]
+        seen_g |= bool(np.any(key_states[:, key_names.index("g")]))
+        seen_shift_q |= bool(np.any(shift & key_states[:, key_names.index("q")]))
+        seen_shift_e |= bool(np.any(shift & key_states[:, key_names.index("e")]))
+
+        expected = np.stack([controller.get_pose() for controller in scalar_controllers])
+        np.testing.assert_array_equal(batch_controller.get_poses(), expected)
+
+    # Make sure that the "reset up" and LSHIFT+q/e paths were actually exercised.
+    assert seen_g and seen_shift_q and seen_shift_e
+
+
+def test_batch_update_with_explicit_up_matches_scalar_update_exactly():
+    rng = np.random.default_rng(54321)
+    n = 10
+    up = [0.0, -1.0, 0.0]
+
+    cameras = make_cameras(rng, n)
+    scalar_controllers = [KeyboardCameraController(camera, up=up) for camera in cameras]
+    batch_controller = BatchKeyboardCameraController(cameras, ups=up)
+
+    time_ms = 0.0
+    for _ in range(100):
+        key_states = rng.random((n, len(BatchKeyboardCameraController.KEY_NAMES))) < 0.3
+        time_ms += 16.0
+
+        for controller, row in zip(scalar_controllers, key_states):
+            controller.update(PressedKeys(row), time_ms)
+        batch_controller.update(key_states, time_ms)
+
+    expected = np.stack([controller.get_pose() for controller in scalar_controllers])
+    np.testing.assert_array_equal(batch_controller.get_poses(), expected)
+
+
+def test_make_key_states_matches_pressed_keys():
+    rng = np.random.default_rng(0)
+    key_states = rng.random((5, len(BatchKeyboardCameraController.KEY_NAMES))) < 0.5
+    made = BatchKeyboardCameraController.make_key_states([PressedKeys(row) for row in key_states])
+    np.testing.assert_array_equal(made, key_states)
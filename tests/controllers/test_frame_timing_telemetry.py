@@ -0,0 +1,29 @@
+import json
+
+from smg.rigging.controllers import FrameTimingTelemetry
+
+
+def test_save_json_writes_valid_json_for_empty_buffer(tmp_path):
+    filename = str(tmp_path / "telemetry.json")
+    FrameTimingTelemetry(8).save_json(filename)
+
+    with open(filename, "r") as f:
+        text = f.read()
+
+    # Note: Python's json module accepts NaN, so check for it explicitly.
+    assert "NaN" not in text
+    data = json.loads(text)
+
+    assert data["frame_count"] == 0
+    assert data["percentiles_ms"] == {"p50": None, "p95": None, "p99": None}
+
+
+def test_ring_buffer_keeps_most_recent_frames():
+    telemetry = FrameTimingTelemetry(4, hitch_threshold_ms=30.0)
+    for i in range(6):
+        telemetry.record(16.0 if i % 2 == 0 else 40.0, float(i), 0.0)
+
+    assert telemetry.get_frame_count() == 6
+    assert telemetry.get_linear_motions().tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert telemetry.get_hitch_count() == 2
+    assert telemetry.get_percentiles((50,)) == {50: 28.0}
@@ -0,0 +1,59 @@
+import numpy as np
+import pygame
+import pytest
+
+from smg.rigging.cameras import SimpleCamera
+from smg.rigging.controllers import FrameTimingTelemetry, KeyboardCameraController
+
+
+class PressedKeys:
+    """A pygame-style pressed key sequence in which only the specified keys are pressed."""
+
+    def __init__(self, *keys: int):
+        self.__keys = set(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.__keys
+
+
+def make_controller(telemetry: FrameTimingTelemetry) -> KeyboardCameraController:
+    camera = SimpleCamera([1, 2, 3], [0, 0, 1], [0, -1, 0])
+    return KeyboardCameraController(
+        camera, canonical_angular_speed=0.05, canonical_frame_time_ms=16.0, canonical_linear_speed=2.0,
+        telemetry=telemetry
+    )
+
+
+def test_first_update_records_nothing():
+    telemetry = FrameTimingTelemetry()
+    controller = make_controller(telemetry)
+    controller.update(PressedKeys(pygame.K_w), 100.0)
+
+    assert controller.get_telemetry() is telemetry
+    assert telemetry.get_frame_count() == 0
+
+
+@pytest.mark.parametrize("dt", [8.0, 16.0, 40.0])
+def test_forward_motion_is_recorded(dt):
+    telemetry = FrameTimingTelemetry()
+    controller = make_controller(telemetry)
+    controller.update(PressedKeys(), 100.0)
+    controller.update(PressedKeys(pygame.K_w), 100.0 + dt)
+
+    assert telemetry.get_frame_count() == 1
+    np.testing.assert_allclose(telemetry.get_frame_times_ms(), [dt])
+    np.testing.assert_allclose(telemetry.get_linear_motions(), [2.0 * dt / 16.0])
+    np.testing.assert_allclose(telemetry.get_angular_motions(), [0.0], atol=1e-7)
+
+
+@pytest.mark.parametrize("dt", [8.0, 16.0, 40.0])
+def test_rotation_is_recorded(dt):
+    telemetry = FrameTimingTelemetry()
+    controller = make_controller(telemetry)
+    controller.update(PressedKeys(), 100.0)
+    controller.update(PressedKeys(pygame.K_LEFT), 100.0 + dt)
+
+    assert telemetry.get_frame_count() == 1
+    np.testing.assert_allclose(telemetry.get_frame_times_ms(), [dt])
+    np.testing.assert_allclose(telemetry.get_linear_motions(), [0.0])
+    np.testing.assert_allclose(telemetry.get_angular_motions(), [0.05 * dt / 16.0], rtol=1e-6)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from smg.rigging.cameras import SimpleCamera
+from smg.rigging.helpers import CameraPoseConverter
+
+
+def make_cameras(n: int):
+    rng = np.random.default_rng(0)
+    return [SimpleCamera(rng.normal(size=3) * 10, rng.normal(size=3), rng.normal(size=3)) for _ in range(n)]
+
+
+def test_cameras_to_poses_matches_camera_to_pose_exactly():
+    cameras = make_cameras(10)
+    expected = np.stack([CameraPoseConverter.camera_to_pose(c) for c in cameras])
+    np.testing.assert_array_equal(CameraPoseConverter.cameras_to_poses(cameras), expected)
+
+
+def test_axes_to_poses_matches_cameras_to_poses_exactly():
+    cameras = make_cameras(10)
+    ps, us, vs, ns = (np.array([getattr(c, axis)() for c in cameras]) for axis in ("p", "u", "v", "n"))
+    np.testing.assert_array_equal(
+        CameraPoseConverter.axes_to_poses(ps, us, vs, ns), CameraPoseConverter.cameras_to_poses(cameras)
+    )
+
+
+def test_invert_rigid_poses_matches_linalg_inv():
+    poses = CameraPoseConverter.cameras_to_poses(make_cameras(10))
+    np.testing.assert_allclose(CameraPoseConverter.invert_rigid_poses(poses), np.linalg.inv(poses), atol=1e-12)
+
+
+def test_poses_to_cameras_round_trips():
+    cameras = make_cameras(10)
+    converted = CameraPoseConverter.poses_to_cameras(CameraPoseConverter.cameras_to_poses(cameras))
+    for camera, result in zip(cameras, converted):
+        for axis in ("p", "n", "u", "v"):
+            np.testing.assert_allclose(getattr(result, axis)(), getattr(camera, axis)(), atol=1e-12)
+
+
+def test_empty_inputs():
+    assert CameraPoseConverter.cameras_to_poses([]).shape == (0, 4, 4)
+    assert CameraPoseConverter.poses_to_cameras(np.zeros((0, 4, 4))) == []
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from scipy.spatial.transform import Rotation
+
+from smg.rigging.cameras import SimpleCamera
+from smg.rigging.helpers import CameraPoseConverter, TrajectoryIO
+
+
+CONVENTIONS = ["opencv", "opengl", "ros"]
+
+
+def make_poses(n: int, scale: float = 1.0) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    cameras = [SimpleCamera(rng.normal(size=3) * scale, rng.normal(size=3), rng.normal(size=3)) for _ in range(n)]
+    return CameraPoseConverter.cameras_to_poses(cameras)
+
+
+@pytest.mark.parametrize("convention", CONVENTIONS)
+def test_tum_round_trip(tmp_path, convention):
+    filename = str(tmp_path / "trajectory.txt")
+    timestamps = np.arange(20) * 0.1 + 1305031102.175304
+    poses = make_poses(20, scale=1e6)
+
+    TrajectoryIO.write_tum(filename, timestamps, poses, convention=convention)
+    read_timestamps, read_poses = TrajectoryIO.read_tum(filename, convention=convention)
+
+    np.testing.assert_array_equal(read_timestamps, timestamps)
+    np.testing.assert_allclose(read_poses[:, 0:3, 0:3], poses[:, 0:3, 0:3], atol=1e-12)
+    np.testing.assert_allclose(read_poses[:, 0:3, 3], poses[:, 0:3, 3], rtol=1e-12, atol=1e-6)
+
+
+@pytest.mark.parametrize("convention", CONVENTIONS)
+def test_kitti_round_trip(tmp_path, convention):
+    filename = str(tmp_path / "trajectory.txt")
+    poses = make_poses(20, scale=1e6)
+
+    TrajectoryIO.write_kitti(filename, poses, convention=convention)
+    read_poses = TrajectoryIO.read_kitti(filename, convention=convention)
+
+    np.testing.assert_allclose(read_poses[:, 0:3, 0:3], poses[:, 0:3, 0:3], atol=1e-12)
+    np.testing.assert_allclose(read_poses[:, 0:3, 3], poses[:, 0:3, 3], rtol=1e-12, atol=1e-6)
+
+
+def test_matrices_round_trip_exactly(tmp_path):
+    filename = str(tmp_path / "trajectory.txt")
+    poses = make_poses(20, scale=1e6)
+
+    TrajectoryIO.write_matrices(filename, poses[:7])
+    TrajectoryIO.write_matrices(filename, poses[7:], append=True)
+
+    np.testing.assert_array_equal(TrajectoryIO.read_matrices(filename), poses)
+
+
+def test_opencv_poses_are_inverse_camera_to_world(tmp_path):
+    filename = str(tmp_path / "trajectory.txt")
+    rng = np.random.default_rng(1)
+    quats = Rotation.random(10, random_state=1).as_quat()
+    trans = rng.normal(size=(10, 3))
+    with open(filename, "w") as f:
+        f.write("# timestamp tx ty tz qx qy qz qw\n")
+        for i in range(10):
+            f.write(" ".join(str(x) for x in [i, *trans[i], *quats[i]]) + "\n")
+
+    camera_to_world = np.tile(np.eye(4), (10, 1, 1))
+    camera_to_world[:, 0:3, 0:3] = Rotation.from_quat(quats).as_matrix()
+    camera_to_world[:, 0:3, 3] = trans
+
+    _, poses = TrajectoryIO.read_tum(filename)
+    np.testing.assert_allclose(poses, np.linalg.inv(camera_to_world), atol=1e-12)
+
+
+def test_conventions_map_camera_axes_correctly():
+    poses = make_poses(5)
+    cameras = CameraPoseConverter.poses_to_cameras(poses)
+
+    opengl = TrajectoryIO.poses_to_camera_to_world(poses, convention="opengl")
+    ros = TrajectoryIO.poses_to_camera_to_world(poses, convention="ros")
+    for i, camera in enumerate(cameras):
+        # OpenGL: x right, y up, z backward.
+        np.testing.assert_allclose(opengl[i, 0:3, 0:3], np.column_stack((-camera.u(), camera.v(), -camera.n())))
+        # ROS: x forward, y left, z up.
+        np.testing.assert_allclose(ros[i, 0:3, 0:3], np.column_stack((camera.n(), camera.u(), camera.v())))
+
+
+def test_chunked_iteration_matches_whole_file_read(tmp_path):
+    poses = make_poses(25)
+    timestamps = np.arange(25, dtype=np.float64)
+
+    tum_filename = str(tmp_path / "tum.txt")
+    TrajectoryIO.write_tum(tum_filename, timestamps, poses)
+    chunks = list(TrajectoryIO.iterate_tum(tum_filename, chunk_size=4))
+    assert [len(t) for t, _ in chunks] == [4, 4, 4, 4, 4, 4, 1]
+    whole_timestamps, whole_poses = TrajectoryIO.read_tum(tum_filename)
+    np.testing.assert_array_equal(np.concatenate([t for t, _ in chunks]), whole_timestamps)
+    np.testing.assert_array_equal(np.concatenate([p for _, p in chunks]), whole_poses)
+
+    kitti_filename = str(tmp_path / "kitti.txt")
+    TrajectoryIO.write_kitti(kitti_filename, poses)
+    np.testing.assert_array_equal(
+        np.concatenate(list(TrajectoryIO.iterate_kitti(kitti_filename, chunk_size=4))),
+        TrajectoryIO.read_kitti(kitti_filename)
+    )
+
+    # Note: The blank lines mean that chunks will end part-way through matrices.
+    matrices_filename = str(tmp_path / "matrices.txt")
+    with open(matrices_filename, "w") as f:
+        for pose in poses:
+            np.savetxt(f, pose, fmt="%.17g")
+            f.write("\n")
+    np.testing.assert_array_equal(
+        np.concatenate(list(TrajectoryIO.iterate_matrices(matrices_filename, chunk_size=3))), poses
+    )
+
+
+@pytest.mark.parametrize("reader, contents", [
+    (TrajectoryIO.read_kitti, "1 2 3 4 5 6 7 8 9 10 11\n1 2 3 4 5 6 7 8 9 10 11 12 13\n"),
+    (TrajectoryIO.read_kitti, "1 2 3 4 5 6 7 8 9 10 11 12 13\n"),
+    (TrajectoryIO.read_tum, "0 1 2 3 0 0 0 1\n0 1 2 3 0 0 0\n"),
+    (TrajectoryIO.read_tum, "0 1 2 3 0 0 0 x\n"),
+    (TrajectoryIO.read_matrices, "1 0 0 0\n0 1 0 0\n0 0 1 0\n"),
+])
+def test_malformed_rows_raise(tmp_path, reader, contents):
+    filename = str(tmp_path / "trajectory.txt")
+    with open(filename, "w") as f:
+        f.write(contents)
+
+    with pytest.raises(RuntimeError):
+        reader(filename)
+
+
+def test_unknown_convention_raises():
+    with pytest.raises(RuntimeError):
+        TrajectoryIO.poses_to_camera_to_world(make_poses(1), convention="unity")
@@ -0,0 +1,111 @@
+import numpy as np
+
+from typing import List
+
+from smg.rigging.cameras import SimpleCamera
+from smg.rigging.helpers import CameraPoseConverter, ViewSelector
+
+
+IMAGE_SIZE = (64, 48)
+INTRINSICS = (50.0, 50.0, 32.0, 24.0)
+
+
+def make_points(n: int = 500) -> np.ndarray:
+    return np.random.default_rng(0).uniform(-3, 3, size=(n, 3))
+
+
+def make_selector() -> ViewSelector:
+    return ViewSelector(make_points(), IMAGE_SIZE, INTRINSICS, max_depth=5.0, min_depth=0.1)
+
+
+def make_poses(m: int = 40) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    cameras = [SimpleCamera(rng.uniform(-1, 1, size=3), rng.normal(size=3), rng.normal(size=3)) for _ in range(m)]
+    return CameraPoseConverter.cameras_to_poses(cameras)
+
+
+def brute_force_visibility(poses: np.ndarray, points: np.ndarray) -> np.ndarray:
+    width, height = IMAGE_SIZE
+    fx, fy, cx, cy = INTRINSICS
+    visibility = np.zeros((len(poses), len(points)), dtype=bool)
+    for i, pose in enumerate(poses):
+        for j, point in enumerate(points):
+            x, y, z = (pose @ np.append(point, 1.0))[0:3]
+            if 0.1 <= z <= 5.0:
+                px, py = fx * x / z + cx, fy * y / z + cy
+                visibility[i, j] = 0 <= px < width and 0 <= py < height
+    return visibility
+
+
+def check_greedy(visibility: np.ndarray, poses: np.ndarray, selected: List[int], min_look_rotation: float) -> None:
+    looks = poses[:, 2, 0:3]
+    covered = np.zeros(visibility.shape[1], dtype=bool)
+    for k, i in enumerate(selected):
+        # Each selected view must have the largest gain of any view that is sufficiently different from
+        # the views selected before it.
+        gains = np.count_nonzero(visibility & ~covered, axis=1)
+        if k > 0:
+            allowed = np.max(looks @ looks[selected[:k]].T, axis=1) <= np.cos(np.deg2rad(min_look_rotation))
+            gains[~allowed] = 0
+        assert gains[i] > 0
+        assert gains[i] == np.max(gains)
+        covered |= visibility[i]
+
+
+def test_compute_visibility_matches_brute_force():
+    selector = make_selector()
+    poses = make_poses()
+    visibility = selector.compute_visibility(poses, chunk_size=16, point_chunk_size=128)
+
+    expected = brute_force_visibility(poses, make_points())
+    assert expected.any()
+    assert visibility.shape == expected.shape
+    np.testing.assert_array_equal(visibility.toarray(), expected)
+
+
+def test_compute_visibility_serial_matches_pooled():
+    selector = make_selector()
+    poses = make_poses()
+    serial = selector.compute_visibility(poses, chunk_size=8)
+    pooled = selector.compute_visibility(poses, chunk_size=8, max_workers=2)
+
+    np.testing.assert_array_equal(serial.indptr, pooled.indptr)
+    np.testing.assert_array_equal(serial.indices, pooled.indices)
+
+
+def test_compute_visibility_with_no_poses():
+    assert make_selector().compute_visibility(np.zeros((0, 4, 4))).shape == (0, 500)
+
+
+def test_select_views_is_greedy():
+    selector = make_selector()
+    poses = make_poses()
+    visibility = selector.compute_visibility(poses)
+    selected = selector.select_views(poses, visibility=visibility)
+
+    check_greedy(visibility.toarray(), poses, selected, 0.0)
+
+    # With no budget, the selected views should cover every point that any of the candidates can see.
+    assert np.count_nonzero(visibility[selected].sum(axis=0)) == np.count_nonzero(visibility.sum(axis=0))
+
+
+def test_select_views_respects_budget():
+    selector = make_selector()
+    poses = make_poses()
+    selected = selector.select_views(poses, budget=3)
+
+    assert len(selected) == 3
+    assert selected == selector.select_views(poses)[:3]
+
+
+def test_select_views_respects_min_look_rotation():
+    selector = make_selector()
+    poses = make_poses()
+    visibility = selector.compute_visibility(poses)
+    selected = selector.select_views(poses, min_look_rotation=45.0, visibility=visibility)
+
+    looks = poses[selected, 2, 0:3]
+    dots = looks @ looks.T
+    assert len(selected) > 1
+    assert np.all(dots[~np.eye(len(selected), dtype=bool)] <= np.cos(np.deg2rad(45.0)))
+    check_greedy(visibility.toarray(), poses, selected, 45.0)
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# The maximum time (in seconds) that importing each subpackage is allowed to take.
+IMPORT_TIME_BUDGET_S = 0.4
+
+# The heavy dependencies that must not be imported as a side effect of importing the package.
+HEAVY_MODULES = ["pygame", "scipy", "vg"]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("module", ["smg.rigging.cameras", "smg.rigging.controllers", "smg.rigging.helpers"])
+def test_import_is_fast_and_avoids_heavy_dependencies(module):
+    # Import the module in a fresh interpreter, so that nothing has been imported already.
+    code = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        "import {}\n"
+        "elapsed = time.perf_counter() - t\n"
+        "print(elapsed)\n"
+        "print(','.join(m for m in {!r} if m in sys.modules))\n"
+    ).format(module, HEAVY_MODULES)
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True
+    )
+
+    elapsed_line, heavy_line = result.stdout.splitlines()[-2:]
+    assert heavy_line == ""
+    assert float(elapsed_line) < IMPORT_TIME_BUDGET_S